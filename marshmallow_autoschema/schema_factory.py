@@ -22,10 +22,12 @@
 
 from datetime import datetime
 from enum import Enum
-from collections import namedtuple
-from functools import partial
+from functools import lru_cache, partial
+from importlib import import_module
+from os import environ
 from inspect import Parameter, signature
 from typing import Callable, Generic, List, Optional, TypeVar, Union
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
 from marshmallow import fields, missing
 from marshmallow.fields import List as FieldList
@@ -41,6 +43,10 @@ class Raw:
 T = TypeVar('T')
 SCHEMA_ATTRNAME = '__schema__'
 MODEL_ATTRNAME = '__model__'
+DEFAULT_SCHEMA_INSTANCE_ATTRNAME = '__default_schema_instance__'
+
+# sentinel distinguishing "kwarg not passed" from any real value
+_MISSING = object()
 
 
 class One(Generic[T]):
@@ -51,33 +57,94 @@ class Many(Generic[T]):
     pass
 
 
+_SIG_CACHE = WeakKeyDictionary()  # type: WeakKeyDictionary
+
+
+def _sig(f):
+    '''
+    Memoized `inspect.signature`. Parsing a signature builds a Parameter
+    object per argument and is measurably slow; callables are immutable
+    enough for the result to be cached for the life of the function.
+    Unhashable or non-weakrefable callables fall back to a fresh parse.
+    '''
+    try:
+        sig = _SIG_CACHE.get(f)
+    except TypeError:
+        return signature(f)
+
+    if sig is None:
+        sig = signature(f)
+        _SIG_CACHE[f] = sig
+
+    return sig
+
+
+_KW_KINDS = frozenset({Parameter.KEYWORD_ONLY, Parameter.POSITIONAL_OR_KEYWORD})
+_KWSIFT_CACHE = WeakKeyDictionary()  # type: WeakKeyDictionary
+
+
+def _kwsift_spec(f):
+    '''
+    Returns the cached `(accepted_names, has_var_keyword)` pair for callable
+    `f`, inspecting its signature on the first call only. `kwsift` sits on
+    the constructor hot path, so the `signature()` cost must not be paid
+    per call.
+    '''
+    try:
+        spec = _KWSIFT_CACHE.get(f)
+    except TypeError:
+        # unhashable or non-weakrefable callables can't be cached
+        spec = None
+        cacheable = False
+    else:
+        cacheable = True
+
+    if spec is None:
+        params = _sig(f).parameters.values()
+        spec = (
+            frozenset(p.name for p in params if p.kind in _KW_KINDS),
+            any(p.kind == p.VAR_KEYWORD for p in params),
+        )
+        if cacheable:
+            _KWSIFT_CACHE[f] = spec
+
+    return spec
+
+
 def kwsift(kw, f):
     '''
     Returns the subset of the kwarg dictionary `kw` that function `f` can
     accept. If `f` is keyword-variadic, return `kw` unchanged.
     '''
 
-    sig = signature(f)
-    kw_kinds = {Parameter.KEYWORD_ONLY, Parameter.POSITIONAL_OR_KEYWORD}
-    out = {}
-    # go backward to catch **kwargs on the first pass
-    for name, p in list(sig.parameters.items())[::-1]:
-        if p.kind == p.VAR_KEYWORD:
-            return kw
-        elif p.kind in kw_kinds and name in kw.keys():
-            out[name] = kw[name]
+    accepted, has_var_keyword = _kwsift_spec(f)
+    if has_var_keyword or not kw:
+        return kw
+
+    # common case: every kwarg is accepted and filtering is a no-op, so
+    # skip allocating a new dict entirely
+    if accepted.issuperset(kw):
+        return kw
 
-    return out
+    # frozenset.intersection accepts the dict directly, keeping the
+    # filter itself in C
+    return {k: kw[k] for k in accepted.intersection(kw)}
 
 
 def get_schema_cls_name(model_cls: type) -> str:
     return model_cls.__name__ + 'Schema'
 
 
+_SCHEMA_CACHE = WeakValueDictionary()  # type: WeakValueDictionary
+
+
 def get_schema_cls(model_cls: type) -> type:
     '''
     Returns the autogenerated schema class from an autoschemad model class.
 
+    Lookups are memoized in a WeakValueDictionary, which the factory
+    populates eagerly at decoration time.
+
     Args:
         model_cls:
             The class object of the model to find the schema for.
@@ -86,27 +153,48 @@ def get_schema_cls(model_cls: type) -> type:
         The schema class object associated with the model class.
 
     '''
+    schema_cls = _SCHEMA_CACHE.get(model_cls)
+    if schema_cls is not None:
+        return schema_cls
+
     sn = get_schema_cls_name(model_cls)
     try:
-        return getattr(model_cls, SCHEMA_ATTRNAME)  # type: ignore
+        schema_cls = getattr(model_cls, SCHEMA_ATTRNAME)  # type: ignore
     except AttributeError:
         raise ValueError(
             '''{} does not appear to be a valid model, as it '
             does not have an autogenerated Schema. Expected to find '
             {} attribute, did not.'''.format(model_cls, sn))
 
+    _SCHEMA_CACHE[model_cls] = schema_cls
+    return schema_cls
+
 
 def is_model_init(init: Callable[..., None]) -> bool:
     '''
     Check if an __init__ callable correponds to one monkeypatched by
     a schema factory.
+
+    Generated inits carry an explicit marker attribute, so this is a
+    plain attribute lookup rather than a signature parse.
     '''
-    return '_mro_offset' in signature(init).parameters.keys()
+    return getattr(init, '_autoschema_patched', False)
 
 
+def _get_type_name(t):
+    # Ptyhon 3.7 no longer has the __name__ property as typing.List is no longer a class.
+    # https://bugs.python.org/issue34422
+    return getattr(t, '__name__', None) or t._name or t.__origin__.__name__
+
+
+@lru_cache(maxsize=256)
 def check_type(typ: type, *typs: type) -> bool:
     '''
-    Checks by name whether a given type is one of several options
+    Checks whether a given type is one of several options, by identity
+    first and by name as a fallback.
+
+    The set of annotation types seen by a process is tiny and bounded, so
+    results are memoized, leaving an O(1) cache hit per call.
 
     Args:
         typ: the type to check
@@ -114,23 +202,260 @@ def check_type(typ: type, *typs: type) -> bool:
     Returns:
         True if `typ` matches any type in `typs`.
     '''
-    def get_type(t):
-        # Ptyhon 3.7 no longer has the __name__ property as typing.List is no longer a class.
-        # https://bugs.python.org/issue34422
-        return getattr(t, '__name__', None) or t._name or t.__origin__.__name__
+    if typ in typs:
+        return True
+
+    name = _get_type_name(typ)
+    return any(name == _get_type_name(t) for t in typs)
+
+
+def _mro_step(model_self, _mro_offset, kwargs):
+    '''
+    Dispatches the parent __init__ for a generated model_init by walking
+    the instance's own MRO.
+
+    This is the dynamic fallback for the cases a decoration-time step
+    cannot see: a generated init invoked mid-chain on a multiply
+    inheriting class, or inherited by an undecorated subclass, where the
+    next class in line depends on the instance's MRO rather than the
+    decorated class's.
+    '''
+
+    next_in_line = model_self.__class__.__mro__[_mro_offset]
+
+    if is_model_init(next_in_line.__init__):
+        next_in_line.__init__(
+            model_self, _mro_offset=_mro_offset + 1,
+            **kwsift(kwargs, next_in_line.__init__),
+        )
+    elif next_in_line is not object:
+        next_in_line.__init__(
+            model_self, **kwsift(kwargs, next_in_line.__init__)
+        )
+
+
+def _generate_model_init(
+        model_cls, base_init, field_setters,
+        next_init=None, store_direct=False):
+    '''
+    Compiles a specialized model __init__ from straight-line source.
+
+    Interpreting the fieldspec list costs a loop iteration and a kind
+    branch per field on every construction; baking each field's handling
+    into generated source at decoration time leaves only the attribute
+    assignments themselves.
+
+    Args:
+        model_cls: the class being decorated. The precomputed parent
+            step is only valid for direct instances of it, so the
+            generated init guards on the instance class and falls back
+            to the dynamic MRO walk otherwise.
+        base_init: the stub __init__ to invoke once attributes are set.
+        field_setters: (kwname, default, kind) triples for the declared
+            fields.
+        next_init: the parent __init__ to dispatch to, resolved from the
+            MRO at decoration time, or None when the parent is `object`.
+        store_direct: if True, write fields straight into the instance
+            __dict__, bypassing attribute-protocol dispatch. Only safe
+            when the class has no custom __setattr__ and no descriptors
+            shadowing field names, so the generated code restricts the
+            direct stores to direct instances of model_cls; subclass
+            instances get plain attribute assignments and keep whatever
+            hooks they define.
+
+    Returns:
+        The compiled model_init function.
+    '''
+
+    namespace = {
+        '_kwsift': kwsift,
+        '_base_init': base_init,
+        '_next_init': next_init,
+        '_missing': _MISSING,
+        '_model_cls': model_cls,
+        '_mro_step': _mro_step,
+    }
+
+    lines = [
+        'def model_init(model_self, _mro_offset=1, **kwargs):',
+        "    '''",
+        "    Factor out the mindnumbing 'self.kwarg = kwarg' pattern.",
+        '',
+        '    That should honestly be the default behaviour.',
+        "    '''",
+        '    if _mro_offset != 1 or model_self.__class__ is not _model_cls:',
+        '        _mro_step(model_self, _mro_offset, kwargs)',
+    ]
+
+    if next_init is not None:
+        if is_model_init(next_init):
+            # a generated parent init continues the chain itself, but
+            # must know where this class sits in the instance's MRO
+            call = ('_next_init(model_self, _mro_offset=_mro_offset + 1, '
+                    '**_kwsift(kwargs, _next_init))')
+        else:
+            call = '_next_init(model_self, **_kwsift(kwargs, _next_init))'
+        lines.append('    else:')
+        lines.append('        ' + call)
+
+    def emit_stores(store, indent):
+        # missing and None both mean "use the default"; an explicit `is`
+        # comparison rather than truthiness, so falsy values like 0, '' or
+        # an existing empty list pass through untouched
+        pad = ' ' * indent
+        for kwname, default, kind in field_setters:
+            default_name = '_d_' + kwname
+            namespace[default_name] = default
+
+            if kind == KIND_LIST:
+                lines.append('{}_v = kwargs.get({!r}, {})'.format(
+                    pad, kwname, default_name))
+                value = '[] if _v is None else _v'
+            elif kind == KIND_RAW:
+                lines.append('{}_v = kwargs.get({!r}, {})'.format(
+                    pad, kwname, default_name))
+                value = '{} if _v is None else _v'
+            elif kind == KIND_FACTORY:
+                lines.append('{}_v = kwargs.get({!r}, _missing)'.format(
+                    pad, kwname))
+                value = '{}() if _v is _missing or _v is None else _v'.format(
+                    default_name)
+            else:
+                value = 'kwargs.get({!r}, {})'.format(kwname, default_name)
+
+            lines.append(pad + store.format(kwname, value))
+
+    all_plain = all(kind == KIND_PLAIN for _, _, kind in field_setters)
+
+    if store_direct and next_init is None and all_plain and field_setters:
+        # fully primitive model with no parent chain: collapse all the
+        # stores into one dict display and a single C-level update call.
+        # As with the per-field dict stores, only direct instances may
+        # skip the attribute protocol
+        for kwname, default, _ in field_setters:
+            namespace['_d_' + kwname] = default
+
+        items = ', '.join(
+            '{!r}: kwargs.get({!r}, _d_{})'.format(kwname, kwname, kwname)
+            for kwname, _, _ in field_setters
+        )
+        lines.append('    if model_self.__class__ is _model_cls:')
+        lines.append('        model_self.__dict__.update({%s})' % items)
+        lines.append('    else:')
+        emit_stores('model_self.{} = {}', 8)
+    elif store_direct and field_setters:
+        # direct instances take the dict-store fast path; instances of
+        # subclasses go through the attribute protocol so a __setattr__
+        # or property they define still fires
+        lines.append('    if model_self.__class__ is _model_cls:')
+        lines.append('        _attrs = model_self.__dict__')
+        emit_stores('_attrs[{!r}] = {}', 8)
+        lines.append('    else:')
+        emit_stores('model_self.{} = {}', 8)
+    else:
+        emit_stores('model_self.{} = {}', 4)
+
+    lines.append('    _base_init(model_self, **_kwsift(kwargs, _base_init))')
+
+    exec(compile('\n'.join(lines), '<autoschema>', 'exec'), namespace)
+    model_init = namespace['model_init']
+    model_init._autoschema_patched = True
+    return model_init
+
+
+_PRIMITIVE_FIELD_MAP = {
+    Raw: fields.Raw,
+    int: fields.Integer,
+    str: fields.String,
+    bool: fields.Boolean,
+    datetime: partial(fields.DateTime, format='iso'),
+}
+
+
+# field "kinds", classified once at decoration time so that model_init
+# branches on a plain int instead of re-running check_type per construction
+KIND_PLAIN = 0
+KIND_LIST = 1
+KIND_RAW = 2
+KIND_FACTORY = 3
+
+
+class Fieldspec:
+    '''
+    Decision data for one declared model field, gathered at decoration
+    time.
+
+    Slotted rather than a namedtuple: one of these lives per field for
+    the lifetime of every decorated class, and co-locating the
+    precomputed kind and serialized name here means downstream consumers
+    read a single object per field.
+    '''
+
+    __slots__ = (
+        'default', 'annotation', 'required', 'allow_none',
+        'kind', 'load_dump_to',
+    )
+
+    def __init__(self, *, default, annotation, required, allow_none,
+                 kind=KIND_PLAIN, load_dump_to=None):
+        self.default = default
+        self.annotation = annotation
+        self.required = required
+        self.allow_none = allow_none
+        self.kind = kind
+        self.load_dump_to = load_dump_to
 
-    return any(get_type(typ) == get_type(t) for t in typs)
+    def __repr__(self):
+        return 'Fieldspec({})'.format(', '.join(
+            '{}={!r}'.format(name, getattr(self, name))
+            for name in self.__slots__
+        ))
 
 
-Fieldspec = namedtuple(
-    'fieldspec', ('default', 'annotation', 'required', 'allow_none'))
+def get_field_kind(fspec: Fieldspec) -> int:
+    '''
+    Classifies a fieldspec into one of the KIND_* constants driving the
+    default-value handling in the generated __init__.
+    '''
+    if check_type(fspec.annotation, Many, List):
+        return KIND_LIST
+    elif check_type(fspec.annotation, Raw):
+        return KIND_RAW
+    elif callable(fspec.default):
+        return KIND_FACTORY
+    else:
+        return KIND_PLAIN
+
+
+def _resolve_default_jit():
+    '''
+    Resolves the jit implementation named by the
+    MARSHMALLOW_SCHEMA_DEFAULT_JIT environment variable, given as a dotted
+    path such as "toastedmarshmallow.Jit". Returns None when unset.
+
+    Raises:
+        ValueError: the variable is set but is not a dotted path.
+    '''
+    path = environ.get('MARSHMALLOW_SCHEMA_DEFAULT_JIT')
+    if not path:
+        return None
+
+    module_name, _, attrname = path.rpartition('.')
+    if not module_name:
+        raise ValueError(
+            'MARSHMALLOW_SCHEMA_DEFAULT_JIT must be a dotted path to a jit '
+            'implementation, such as "toastedmarshmallow.Jit"; '
+            'got "{}".'.format(path))
+
+    return getattr(import_module(module_name), attrname)
 
 
 class schema_metafactory:
 
     def __init__(
             self, *, field_namer=lambda x: x,
-            schema_base_class=FactorySchema, extended_field_map=None):
+            schema_base_class=FactorySchema, extended_field_map=None,
+            jit=None):
         '''
         Creates a domain-specific schema factory.
 
@@ -143,6 +468,10 @@ class schema_metafactory:
             marshmallow
                 field types. Can be used to implement domain specific field
                 types.
+            jit: optional jit implementation, e.g. `toastedmarshmallow.Jit`,
+                installed on the Meta of every generated schema. Defaults to
+                the MARSHMALLOW_SCHEMA_DEFAULT_JIT environment variable when
+                set, and is a no-op otherwise.
 
         Returns:
             schema_factory: class decorator wrapping a model stub class and
@@ -156,6 +485,7 @@ class schema_metafactory:
         self.schema_base_class = schema_base_class
 
         self.extended_field_map = extended_field_map or {}
+        self.jit = jit if jit is not None else _resolve_default_jit()
 
     @staticmethod
     def get_primitive_field_cls(typ: type, instantiate=False)\
@@ -176,28 +506,16 @@ class schema_metafactory:
         Raises:
             ValueError: `typ` doesn't correpond to a basic field type.
         '''
-        if issubclass(typ, Enum):
-            field_constr = partial(EnumField, typ)
-
-        elif typ == Raw:
-            field_constr = fields.Raw
-
-        elif typ == int:
-            field_constr = fields.Integer
-
-        elif typ == str:
-            field_constr = fields.String
-
-        elif typ == bool:
-            field_constr = fields.Boolean
+        field_constr = _PRIMITIVE_FIELD_MAP.get(typ)
 
-        elif typ == datetime:
-            field_constr = partial(fields.DateTime, format='iso')
-
-        else:
-            raise ValueError(
-                '{} does not correspond to a primitive field type'.format(typ)
-            )
+        if field_constr is None:
+            if isinstance(typ, type) and issubclass(typ, Enum):
+                field_constr = partial(EnumField, typ)
+            else:
+                raise ValueError(
+                    '{} does not correspond to a primitive field type'
+                    .format(typ)
+                )
 
         return field_constr if not instantiate else field_constr()
 
@@ -277,39 +595,73 @@ class schema_metafactory:
 
         base_init = model_cls.__init__  # type: ignore
 
-        # parse init to construct st_fieldspecs
-        init_named_kwargs = {
-            name: Fieldspec(
-                default=(
-                    p.default if p.default is not Parameter.empty else None
-                ),
+        # warm the kwsift cache now so model_init never pays for
+        # signature() at construction time
+        _kwsift_spec(base_init)
+
+        # loop invariants: the irregular-name overrides are merged with a
+        # single explicit MRO walk (derived classes win, matching getattr
+        # resolution) and the namer is bound once, not once per field
+        irregular = {}
+        for model_base in reversed(model_cls.__mro__):
+            declared = model_base.__dict__.get('irregular_names')
+            if declared:
+                irregular.update(declared)
+        namer = self.field_namer
+
+        # parse init to construct st_fieldspecs; the signature is walked
+        # exactly once here, and the fieldspecs carry every decoration-time
+        # decision (kind, serialized name) for downstream consumers
+        init_named_kwargs = {}
+        for name, p in _sig(base_init).parameters.items():
+            if p.kind != Parameter.KEYWORD_ONLY:
+                continue
+
+            default = p.default
+            required = default is Parameter.empty
+            fspec = Fieldspec(
+                default=None if required else default,
                 annotation=p.annotation,
-                required=p.default == p.empty,
-                allow_none=p.default is None,
+                required=required,
+                allow_none=default is None,
+                load_dump_to=irregular.get(name) or namer(name),
             )
-            for name, p in signature(base_init).parameters.items()
-            if p.kind == p.KEYWORD_ONLY
-        }
+            fspec.kind = get_field_kind(fspec)
+            init_named_kwargs[name] = fspec
+
+        model_cls.__autoschema_fields__ = tuple(init_named_kwargs.items())
 
         schema_attrs = {}
 
         # generate field objects from fieldspecs
         for kwname, fspec in init_named_kwargs.items():
-            load_dump_to = getattr(
-                model_cls, 'irregular_names', {}
-            ).get(kwname, self.field_namer(kwname))
-
-            schema_attrs[kwname] = self.get_field_from_annotation(
-                fspec, load_dump_to=load_dump_to,
+            field = self.get_field_from_annotation(
+                fspec, load_dump_to=fspec.load_dump_to,
             )
+            # tagged from the constructed field rather than the fieldspec
+            # kind: Many[model] builds a Nested(many=True), not a List
+            field._autoschema_is_list = isinstance(field, FieldList)
+            schema_attrs[kwname] = field
+
+        if self.jit is not None:
+            # toastedmarshmallow-style jits look for a `jit` attribute on
+            # the schema Meta; zero cost when the feature isn't requested
+            schema_attrs['Meta'] = type('Meta', (), {'jit': self.jit})
 
         # construct the dependent Schema class
         # mirror the model inhertance structure in the schema, important!
-        schema_bases = tuple(
-            model_base.__dict__[SCHEMA_ATTRNAME]
-            for model_base in model_cls.__mro__
-            if SCHEMA_ATTRNAME in model_base.__dict__
-        ) + (self.schema_base_class,)
+        # single pass over the MRO, with one dict .get per base; nothing
+        # past object can carry a schema, so stop there
+        schema_attrname = SCHEMA_ATTRNAME
+        bases = []
+        for model_base in model_cls.__mro__:
+            if model_base is object:
+                break
+            base_schema = model_base.__dict__.get(schema_attrname)
+            if base_schema is not None:
+                bases.append(base_schema)
+        bases.append(self.schema_base_class)
+        schema_bases = tuple(bases)
 
         schema_cls = type(
             get_schema_cls_name(model_cls), schema_bases, schema_attrs,
@@ -317,57 +669,68 @@ class schema_metafactory:
 
         setattr(model_cls, SCHEMA_ATTRNAME, schema_cls)
         setattr(schema_cls, MODEL_ATTRNAME, model_cls)
+        _SCHEMA_CACHE[model_cls] = schema_cls
+
+        # schema instantiation is non-trivial (field binding, meta
+        # processing), so keep one default-configured instance around for
+        # the common dump/load-with-no-arguments case
+        setattr(
+            model_cls, DEFAULT_SCHEMA_INSTANCE_ATTRNAME,
+            schema_cls(strict=True),
+        )
 
-        def model_init(model_self, _mro_offset=1, **kwargs):
-            '''
-            Factor out the mindnumbing 'self.kwarg = kwarg' pattern.
-
-            That should honestly be the default behaviour.
-            '''
-
-            # XXX: super(self.__class__, self).__init__ seems to fail
-            # in a monkeypatched __init__ such as this one, forcing this kind
-            # of manual __mro__ traversal. I'm sure something more sensible
-            # can be done. This is the kind of stuff that gives metaprogramming
-            # a bad name... blame super()'s super opacity
-
-            cur_model_cls = model_self.__class__
-            next_in_line = cur_model_cls.__mro__[_mro_offset]
-
-            if is_model_init(next_in_line.__init__):
-                next_in_line.__init__(
-                    model_self, _mro_offset=_mro_offset + 1,
-                    **kwsift(kwargs, next_in_line.__init__),
-                )
-            elif next_in_line is not object:
-                next_in_line.__init__(
-                    model_self, **kwsift(kwargs, next_in_line.__init__)
-                )
-
-            for kwname, fspec in init_named_kwargs.items():
-                attr = kwargs.get(kwname, fspec.default)
-
-                if check_type(fspec.annotation, Many, List):
-                    attr = attr or []
-                elif check_type(fspec.annotation, Raw):
-                    attr = attr or {}
-                elif callable(fspec.default):
-                    attr = attr or fspec.default()
+        # flatten the fieldspecs for the init generator, which only needs
+        # the name, default and precomputed kind. The frozen tuple of
+        # tuples is also published on the class: a uniform flat container
+        # a compiled extension could consume wholesale, should the
+        # assignment loop ever be lowered out of Python
+        field_setters = tuple(
+            (kwname, fspec.default, fspec.kind)
+            for kwname, fspec in init_named_kwargs.items()
+        )
+        model_cls.__autoschema_fields_flat__ = field_setters
+
+        # XXX: super(self.__class__, self).__init__ seems to fail
+        # in a monkeypatched __init__ such as this one, so the parent
+        # __init__ is resolved from the MRO instead. The first step is
+        # precomputed here for direct instances; continuation steps and
+        # subclass instances go through the dynamic _mro_step walk, which
+        # is what keeps every branch of a multiple-inheritance hierarchy
+        # initialized.
+        next_in_line = model_cls.__mro__[1]
+        next_init = (
+            next_in_line.__init__ if next_in_line is not object else None
+        )
 
-                setattr(model_self, kwname, attr)
+        # plain attribute stores can be turned into instance-dict writes
+        # as long as nothing customizes attribute assignment
+        store_direct = model_cls.__setattr__ is object.__setattr__ and not any(
+            hasattr(getattr(model_cls, kwname, None), '__set__')
+            for kwname, _, _ in field_setters
+        )
 
-            base_init(model_self, **kwsift(kwargs, base_init))
+        model_init = _generate_model_init(
+            model_cls, base_init, field_setters,
+            next_init=next_init, store_direct=store_direct)
 
         def model_dump(model_self, *args, **kwargs):
             strict = kwargs.pop('strict', True)
-            schema_instance = getattr(model_self, SCHEMA_ATTRNAME)(
-                *args, strict=strict, **kwargs)
+            if strict and not args and not kwargs:
+                schema_instance = getattr(
+                    model_self, DEFAULT_SCHEMA_INSTANCE_ATTRNAME)
+            else:
+                schema_instance = getattr(model_self, SCHEMA_ATTRNAME)(
+                    *args, strict=strict, **kwargs)
             return schema_instance.dump(model_self)
 
         def model_load(cls, data, *args, **kwargs):
             strict = kwargs.pop('strict', True)
-            schema_instance = getattr(cls, SCHEMA_ATTRNAME)(
-                *args, strict=strict, **kwargs)
+            if strict and not args and not kwargs:
+                schema_instance = getattr(
+                    cls, DEFAULT_SCHEMA_INSTANCE_ATTRNAME)
+            else:
+                schema_instance = getattr(cls, SCHEMA_ATTRNAME)(
+                    *args, strict=strict, **kwargs)
             return schema_instance.load(data)
 
         model_cls.dump = model_dump
@@ -402,11 +765,18 @@ def validate_field(attr, validator, validate_child=True):
 
         schema_cls = getattr(model_cls, SCHEMA_ATTRNAME)
         field = schema_cls._declared_fields[attr]
-        if isinstance(field, FieldList) and validate_child:
+        if getattr(field, '_autoschema_is_list', False) and validate_child:
             field.container.validators.append(validator)
         else:
             field.validators.append(validator)
 
+        # the cached default instance deep-copied its fields at
+        # construction time, so rebuild it with the new validator in place
+        setattr(
+            model_cls, DEFAULT_SCHEMA_INSTANCE_ATTRNAME,
+            schema_cls(strict=True),
+        )
+
         return model_cls
 
     return valdeco
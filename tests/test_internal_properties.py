@@ -20,3 +20,16 @@ def test_model_is_constructor():
 
 def test_init_body_called_after_attributes_set():
     assert 30 == DataStructure(count=5, factor=6).derived
+
+
+def test_subclass_setattr_hook_is_honored():
+    seen = []
+
+    class Tracking(DataStructure):
+        def __setattr__(self, name, value):
+            seen.append(name)
+            super().__setattr__(name, value)
+
+    Tracking(count=5, factor=6)
+    assert 'count' in seen
+    assert 'factor' in seen
@@ -0,0 +1,40 @@
+from pytest import raises
+
+from marshmallow_autoschema import schema_metafactory
+
+
+class FakeJit:
+    pass
+
+
+def make_model(factory):
+    @factory
+    class Data:
+        def __init__(self, *,
+                     value: int = 0) -> None: pass
+    return Data
+
+
+def test_jit_parameter_lands_on_schema_meta(monkeypatch):
+    monkeypatch.delenv('MARSHMALLOW_SCHEMA_DEFAULT_JIT', raising=False)
+    model_cls = make_model(schema_metafactory(jit=FakeJit))
+    assert model_cls.__schema__.Meta.jit is FakeJit
+
+
+def test_no_jit_by_default(monkeypatch):
+    monkeypatch.delenv('MARSHMALLOW_SCHEMA_DEFAULT_JIT', raising=False)
+    model_cls = make_model(schema_metafactory())
+    assert 'Meta' not in vars(model_cls.__schema__)
+
+
+def test_jit_from_environment(monkeypatch):
+    monkeypatch.setenv(
+        'MARSHMALLOW_SCHEMA_DEFAULT_JIT', 'tests.test_jit.FakeJit')
+    model_cls = make_model(schema_metafactory())
+    assert model_cls.__schema__.Meta.jit is FakeJit
+
+
+def test_jit_environment_variable_requires_dotted_path(monkeypatch):
+    monkeypatch.setenv('MARSHMALLOW_SCHEMA_DEFAULT_JIT', 'toastedmarshmallow')
+    with raises(ValueError):
+        schema_metafactory()
@@ -22,7 +22,7 @@
 from datetime import datetime, timezone
 from enum import Enum
 
-from marshmallow_autoschema import Many, One, autoschema
+from marshmallow_autoschema import Many, One, Raw, autoschema
 
 
 def test_dump_native_types():
@@ -123,6 +123,35 @@ def test_default_list_is_distinct_per_instance():
     assert a.list_objects is not b.list_objects
 
 
+def test_falsy_values_survive_construction():
+    payload = {}
+    tags = []
+    obj = MyDefaulted(payload=payload, tags=tags, label="")
+
+    assert obj.payload is payload
+    assert obj.tags is tags
+    assert obj.label == ""
+
+
+def test_none_still_substitutes_defaults():
+    obj = MyDefaulted(payload=None, tags=None)
+
+    assert obj.payload == {}
+    assert obj.tags == []
+
+
+def test_callable_default_is_invoked_when_omitted():
+    obj = MyDefaulted()
+
+    assert isinstance(obj.created, datetime)
+
+
+def test_callable_default_is_invoked_on_none():
+    obj = MyDefaulted(created=None)
+
+    assert isinstance(obj.created, datetime)
+
+
 # noinspection PyArgumentList
 def test_with_type_inherit():
     obj = MySubObject(my_integer=1,
@@ -143,6 +172,18 @@ def test_with_type_inherit():
     }
 
 
+# noinspection PyArgumentList
+def test_with_multiple_inheritance():
+    obj = MyMultiObject(my_integer=1,
+                        my_extra="side",
+                        my_other_integer=2)
+
+    out, errors = obj.dump()
+    assert out["my_integer"] == 1
+    assert out["my_extra"] == "side"
+    assert out["my_other_integer"] == 2
+
+
 class MyEnum(Enum):
     Red = '#ff0000'
     Green = '#00ff00'
@@ -174,3 +215,30 @@ class MySubObject(MyObject):
     def __init__(self, *,
                  my_other_integer: int = 0) -> None:
         pass
+
+
+@autoschema
+class MyDefaulted:
+
+    def __init__(self, *,
+                 payload: Raw = None,
+                 tags: Many[MyEnum] = None,
+                 label: str = "named",
+                 created: datetime = datetime.utcnow) -> None:
+        pass
+
+
+@autoschema
+class MySideObject:
+
+    def __init__(self, *,
+                 my_extra: str = "") -> None:
+        pass
+
+
+@autoschema
+class MyMultiObject(MyObject, MySideObject):
+
+    def __init__(self, *,
+                 my_other_integer: int = 0) -> None:
+        pass